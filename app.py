@@ -1,20 +1,18 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import pyarrow as pa
 import os
 import sys
+import hashlib
+import threading
+import uuid
+from collections import Counter
+from html import escape
 from pathlib import Path
 
-# Add src to path for imports
+# Add src to path for imports (analysis modules are imported by the pages that use them)
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from pdf_parser import extract_resume_data
-from nlp_analyzer import analyze_candidate_profile, classify_domain
-from visualization import create_skills_chart, create_experience_chart, create_domain_distribution
-from candidate_matcher import calculate_match_score, rank_candidates
-
 # Page configuration
 st.set_page_config(
     page_title="Resume Analysis Platform",
@@ -23,37 +21,104 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #2E86AB;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #2E86AB;
-        margin: 0.5rem 0;
+# Maximum number of analyzed resumes kept in the content-hash cache
+ANALYSIS_CACHE_MAX_ENTRIES = 256
+
+# Default for the "Archive uploads" option, which keeps a copy of every
+# analyzed PDF in uploads/ for auditing or reprocessing
+SAVE_UPLOADS = False
+
+# Default PDF text extractor, overridable with the RESUME_PARSER environment variable
+PARSER_BACKEND = os.environ.get("RESUME_PARSER", "auto")
+
+# Number of ranked candidates shown on the Job Matching page
+TOP_MATCHES = 10
+
+# Candidate fields needed to score and display job matches
+MATCH_COLUMNS = ['name', 'email', 'domain', 'experience_years', 'skills', 'skills_lc']
+
+# Number of candidate cards shown per page on the Candidate Dashboard
+CANDIDATES_PER_PAGE = 20
+
+# Number of skills listed on each dashboard card
+CARD_SKILLS_SHOWN = 8
+
+@st.cache_resource
+def load_css():
+    """Read the app stylesheet once per process and prepend it to the page header."""
+    css = (Path(__file__).parent / 'assets' / 'style.css').read_text()
+    return f'<style>\n{css}</style>\n<h1 class="main-header">📄 Resume Analysis Platform</h1>'
+
+@st.cache_resource
+def get_analysis_cache():
+    """Process-wide cache of candidate info keyed by (PDF content hash, parser backend)."""
+    return {}
+
+@st.cache_resource
+def get_analysis_cache_lock():
+    """Lock around the analysis cache, which every session reads and writes."""
+    return threading.Lock()
+
+# Arrow type of the skills columns: one list of skill names per candidate
+SKILLS_DTYPE = pd.ArrowDtype(pa.list_(pa.string()))
+
+def build_candidates_df(candidates_data):
+    """Build the candidates DataFrame with Arrow-backed skill columns."""
+    if not candidates_data:
+        return pd.DataFrame()
+    
+    # Collect each column as a list so pandas does not have to walk the records
+    columns = {
+        column: [candidate[column] for candidate in candidates_data]
+        for column in candidates_data[0]
     }
-    .candidate-card {
-        background-color: #ffffff;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border: 1px solid #ddd;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    # Display string for the dashboard cards, built once instead of per rerun
+    columns['skills_preview'] = [", ".join(skills[:CARD_SKILLS_SHOWN]) for skills in columns['skills']]
+    columns['skills'] = pd.array(columns['skills'], dtype=SKILLS_DTYPE)
+    columns['skills_lc'] = pd.array(columns['skills_lc'], dtype=SKILLS_DTYPE)
+    return pd.DataFrame(columns)
+
+@st.cache_data(max_entries=32)
+def get_candidate_stats(candidates_version, _candidates_df):
+    """
+    Summary statistics of the analyzed candidates.
+    
+    Cached on candidates_version, which changes whenever a new analysis is
+    stored, so reruns reuse the stats instead of rescanning the DataFrame.
+    """
+    import pyarrow.compute as pc
+    
+    return {
+        'total_candidates': len(_candidates_df),
+        'domains': _candidates_df['domain'].unique().tolist(),
+        'avg_experience': float(_candidates_df['experience_years'].mean()),
+        'total_skills': pc.sum(pc.list_value_length(pa.array(_candidates_df['skills']))).as_py() or 0
     }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource(max_entries=32)
+def get_skill_index(candidates_version, _candidates_df):
+    """
+    Inverted index from normalized skill to the DataFrame rows that list it.
+    
+    Built once per analysis (keyed on candidates_version) and shared read-only,
+    so a skill search scans the distinct skills instead of every candidate.
+    """
+    skill_index = {}
+    for row, skills_lc in zip(_candidates_df.index, _candidates_df['skills_lc']):
+        for skill in skills_lc:
+            skill_index.setdefault(skill, []).append(row)
+    return skill_index
+
+def get_candidates_df():
+    """Return the analyzed candidates DataFrame, or None if nothing has been analyzed."""
+    df = st.session_state.get('candidates_df')
+    if df is None or df.empty:
+        return None
+    return df
 
 def main():
-    # Header
-    st.markdown('<h1 class="main-header">📄 Resume Analysis Platform</h1>', unsafe_allow_html=True)
+    # Custom CSS and header, sent together as one element
+    st.markdown(load_css(), unsafe_allow_html=True)
     
     # Sidebar for navigation
     st.sidebar.title("Navigation")
@@ -70,8 +135,23 @@ def main():
         analytics_page()
 
 def upload_and_analyze_page():
+    from pdf_parser import PARSER_BACKENDS
+    from resume_pipeline import process_resumes_parallel
+    
     st.header("📤 Upload and Analyze Resumes")
     
+    parser_backend = st.sidebar.selectbox(
+        "PDF parser",
+        PARSER_BACKENDS,
+        index=PARSER_BACKENDS.index(PARSER_BACKEND) if PARSER_BACKEND in PARSER_BACKENDS else 0,
+        help="'auto' uses pdfplumber with PyPDF2 as a fallback; other backends fall back to it if they find no text"
+    )
+    archive_uploads = st.sidebar.checkbox(
+        "Archive uploads",
+        value=SAVE_UPLOADS,
+        help="Also save analyzed PDFs to the uploads/ folder (files are parsed in memory either way)"
+    )
+    
     col1, col2 = st.columns([2, 1])
     
     with col1:
@@ -86,48 +166,80 @@ def upload_and_analyze_page():
         if uploaded_files:
             st.success(f"📁 {len(uploaded_files)} files uploaded successfully!")
             
-            # Save uploaded files
-            upload_dir = Path("uploads")
-            upload_dir.mkdir(exist_ok=True)
-            
             if st.button("🔍 Analyze Resumes", type="primary"):
                 with st.spinner("Analyzing resumes... This may take a few moments."):
-                    candidates_data = []
+                    analysis_cache = get_analysis_cache()
+                    cache_lock = get_analysis_cache_lock()
+                    results = [None] * len(uploaded_files)
                     
-                    for uploaded_file in uploaded_files:
-                        # Save file
-                        file_path = upload_dir / uploaded_file.name
-                        with open(file_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
-                        
-                        # Extract and analyze data
-                        try:
-                            resume_data = extract_resume_data(str(file_path))
-                            profile = analyze_candidate_profile(resume_data)
-                            domain = classify_domain(profile['skills'])
-                            
-                            candidate_info = {
-                                'name': profile.get('name', 'Unknown'),
-                                'email': profile.get('email', 'Not provided'),
-                                'phone': profile.get('phone', 'Not provided'),
-                                'domain': domain,
-                                'experience_years': profile.get('experience_years', 0),
-                                'skills': profile.get('skills', []),
-                                'education': profile.get('education', 'Not specified'),
-                                'filename': uploaded_file.name
-                            }
-                            candidates_data.append(candidate_info)
-                            
-                        except Exception as e:
-                            st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+                    if archive_uploads:
+                        upload_dir = Path("uploads")
+                        upload_dir.mkdir(exist_ok=True)
                     
-                    # Store results in session state
-                    st.session_state['candidates_data'] = candidates_data
+                    # Files already analyzed in this session, keyed by (name, size, parser)
+                    analyzed_index = st.session_state.get('analyzed_index', {})
+                    fingerprints = [(uploaded_file.name, uploaded_file.size, parser_backend) for uploaded_file in uploaded_files]
+                    
+                    # Reuse cached results for identical files, parse the rest from memory
+                    pending, file_sources, file_names, digests = [], [], [], []
+                    for index, uploaded_file in enumerate(uploaded_files):
+                        # Archive every upload, including ones answered from a cache
+                        file_bytes = None
+                        if archive_uploads:
+                            file_bytes = uploaded_file.getvalue()
+                            archive_upload(upload_dir / uploaded_file.name, file_bytes)
+                        
+                        if fingerprints[index] in analyzed_index:
+                            results[index] = analyzed_index[fingerprints[index]]
+                            continue
+                        
+                        if file_bytes is None:
+                            file_bytes = uploaded_file.getvalue()
+                        digest = (hashlib.sha256(file_bytes).hexdigest(), parser_backend)
+                        
+                        with cache_lock:
+                            cached_info = analysis_cache.get(digest)
+                        if cached_info is not None:
+                            results[index] = dict(cached_info, filename=uploaded_file.name)
+                            continue
+                        
+                        pending.append(index)
+                        file_sources.append(file_bytes)
+                        file_names.append(uploaded_file.name)
+                        digests.append(digest)
+
+                    # Extract and analyze new files in parallel, keeping upload order
+                    progress_bar = st.progress(0.0)
+
+                    for done, (position, candidate_info, error) in enumerate(process_resumes_parallel(file_sources, file_names, backend=parser_backend), start=1):
+                        index = pending[position]
+                        if error is not None:
+                            st.error(f"Error processing {uploaded_files[index].name}: {str(error)}")
+                        else:
+                            results[index] = candidate_info
+                            with cache_lock:
+                                if len(analysis_cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+                                    analysis_cache.pop(next(iter(analysis_cache)), None)
+                                analysis_cache[digests[position]] = dict(candidate_info)
+                        progress_bar.progress(done / len(file_sources))
+                    progress_bar.progress(1.0)
+
+                    # Index only the current uploads so removed files are forgotten
+                    st.session_state['analyzed_index'] = {
+                        fingerprint: info
+                        for fingerprint, info in zip(fingerprints, results)
+                        if info is not None
+                    }
+                    candidates_data = [info for info in results if info is not None]
+
+                    # Store results in session state (only the DataFrame is kept)
+                    st.session_state['candidates_df'] = build_candidates_df(candidates_data)
+                    st.session_state['candidates_version'] = uuid.uuid4().hex
                     
                     # Display results
                     if candidates_data:
                         st.success(f"✅ Successfully analyzed {len(candidates_data)} resumes!")
-                        display_candidate_summary(candidates_data)
+                        display_candidate_summary(st.session_state['candidates_df'])
     
     with col2:
         st.subheader("💡 Tips")
@@ -139,143 +251,185 @@ def upload_and_analyze_page():
         - Supported domains: ML/AI, Frontend, Backend, Data Engineering, DevOps
         """)
 
-def display_candidate_summary(candidates_data):
+def archive_upload(file_path, file_bytes):
+    """Write an uploaded PDF to disk without keeping its pages in the OS cache."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(file_bytes)
+        while view:
+            view = view[os.write(fd, view):]
+        # Archived copies are never read back by the app
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+def display_candidate_summary(candidates_df):
     st.subheader("📊 Analysis Summary")
     
-    if not candidates_data:
+    if candidates_df.empty:
         st.warning("No candidates data available.")
         return
     
+    stats = get_candidate_stats(st.session_state['candidates_version'], candidates_df)
+    
     # Metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Candidates", len(candidates_data))
+        st.metric("Total Candidates", stats['total_candidates'])
     
     with col2:
-        domains = [c['domain'] for c in candidates_data]
-        unique_domains = len(set(domains))
-        st.metric("Unique Domains", unique_domains)
+        st.metric("Unique Domains", len(stats['domains']))
     
     with col3:
-        avg_experience = sum(c['experience_years'] for c in candidates_data) / len(candidates_data)
-        st.metric("Avg Experience", f"{avg_experience:.1f} years")
+        st.metric("Avg Experience", f"{stats['avg_experience']:.1f} years")
     
     with col4:
-        total_skills = sum(len(c['skills']) for c in candidates_data)
-        st.metric("Total Skills Found", total_skills)
+        st.metric("Total Skills Found", stats['total_skills'])
     
-    # Quick preview of candidates
+    # Quick preview of candidates, sent as one Arrow-encoded table
     st.subheader("👥 Candidates Preview")
-    for i, candidate in enumerate(candidates_data[:5]):  # Show first 5
-        with st.expander(f"👤 {candidate['name']} - {candidate['domain']}"):
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write(f"**Email:** {candidate['email']}")
-                st.write(f"**Experience:** {candidate['experience_years']} years")
-                st.write(f"**Domain:** {candidate['domain']}")
-            with col2:
-                st.write(f"**Skills:** {', '.join(candidate['skills'][:5])}")
-                if len(candidate['skills']) > 5:
-                    st.write(f"... and {len(candidate['skills']) - 5} more")
+    st.dataframe(
+        candidates_df[['name', 'email', 'domain', 'experience_years', 'skills']],
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'name': "Name",
+            'email': "Email",
+            'domain': "Domain",
+            'experience_years': st.column_config.NumberColumn("Experience (years)"),
+            'skills': st.column_config.ListColumn("Skills")
+        }
+    )
 
 def candidate_dashboard_page():
     st.header("👥 Candidate Dashboard")
     
-    if 'candidates_data' not in st.session_state or not st.session_state['candidates_data']:
+    df = get_candidates_df()
+    if df is None:
         st.warning("No candidate data available. Please upload and analyze resumes first.")
         return
     
-    candidates_data = st.session_state['candidates_data']
-    df = pd.DataFrame(candidates_data)
+    domains = get_candidate_stats(st.session_state['candidates_version'], df)['domains']
     
-    # Filters
+    # Filters (applied on submit rather than on every widget change)
     st.subheader("🔍 Filters")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        domain_filter = st.multiselect("Domain", df['domain'].unique(), default=df['domain'].unique())
-    
-    with col2:
-        min_exp, max_exp = st.slider("Experience Range (years)", 0, 20, (0, 20))
-    
-    with col3:
-        search_skill = st.text_input("Search by Skill")
+    with st.form("dashboard_filters"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            domain_filter = st.multiselect("Domain", domains, default=domains)
+        
+        with col2:
+            min_exp, max_exp = st.slider("Experience Range (years)", 0, 20, (0, 20))
+        
+        with col3:
+            search_skill = st.text_input("Search by Skill")
+        
+        st.form_submit_button("Apply Filters")
     
-    # Apply filters
-    filtered_df = df[df['domain'].isin(domain_filter)]
-    filtered_df = filtered_df[(filtered_df['experience_years'] >= min_exp) & 
-                             (filtered_df['experience_years'] <= max_exp)]
+    # Apply filters: combine every predicate into one mask and slice once
+    mask = df['domain'].isin(domain_filter) & df['experience_years'].between(min_exp, max_exp)
     
     if search_skill:
-        filtered_df = filtered_df[filtered_df['skills'].apply(
-            lambda skills: any(search_skill.lower() in skill.lower() for skill in skills)
-        )]
+        # Match the query against the distinct skills, then look up their candidates
+        query = search_skill.lower()
+        skill_index = get_skill_index(st.session_state['candidates_version'], df)
+        matching_rows = set()
+        for skill, rows in skill_index.items():
+            if query in skill:
+                matching_rows.update(rows)
+        mask &= df.index.isin(matching_rows)
+    
+    filtered_df = df[mask]
     
     # Display filtered candidates
     st.subheader(f"📋 Candidates ({len(filtered_df)} found)")
     
-    for _, candidate in filtered_df.iterrows():
-        with st.container():
-            st.markdown(f"""
-            <div class="candidate-card">
-                <h4>👤 {candidate['name']}</h4>
-                <p><strong>Domain:</strong> {candidate['domain']} | <strong>Experience:</strong> {candidate['experience_years']} years</p>
-                <p><strong>Email:</strong> {candidate['email']} | <strong>Phone:</strong> {candidate['phone']}</p>
-                <p><strong>Skills:</strong> {', '.join(candidate['skills'][:8])}</p>
-                <p><strong>Education:</strong> {candidate['education']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    # Only the current page of candidates is converted and rendered
+    page_count = max(1, -(-len(filtered_df) // CANDIDATES_PER_PAGE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    start = (page - 1) * CANDIDATES_PER_PAGE
+    page_df = filtered_df.iloc[start:start + CANDIDATES_PER_PAGE]
+    
+    # Render all cards as a single element instead of one per candidate.
+    # Resume text is untrusted, so every value is escaped before it goes into HTML.
+    cards_html = "".join(
+        f'<div class="candidate-card">'
+        f'<h4>👤 {escape(candidate["name"])}</h4>'
+        f'<p><strong>Domain:</strong> {escape(candidate["domain"])} | <strong>Experience:</strong> {candidate["experience_years"]} years</p>'
+        f'<p><strong>Email:</strong> {escape(candidate["email"])} | <strong>Phone:</strong> {escape(candidate["phone"])}</p>'
+        f'<p><strong>Skills:</strong> {escape(candidate["skills_preview"])}</p>'
+        f'<p><strong>Education:</strong> {escape(str(candidate["education"]))}</p>'
+        f'</div>'
+        for candidate in page_df.to_dict('records')
+    )
+    st.markdown(cards_html, unsafe_allow_html=True)
+
+@st.cache_data(max_entries=64)
+def get_ranked_candidates(candidates_version, job_key, _candidates_df):
+    """
+    Top matches for a job, cached on the analysis version and the job spec.
+    
+    job_key is (domain, required_experience, required_skills, job_description);
+    resubmitting an unchanged job returns the stored ranking without rescoring.
+    """
+    from candidate_matcher import find_best_matches
+    
+    job_domain, required_experience, required_skills, job_description = job_key
+    
+    # Only materialize the columns used for scoring and the results panel
+    candidates = _candidates_df[MATCH_COLUMNS].to_dict('records')
+    return find_best_matches(candidates, {
+        'domain': job_domain,
+        'required_experience': required_experience,
+        'required_skills': list(required_skills),
+        'job_description': job_description
+    }, top_n=TOP_MATCHES)
 
 def job_matching_page():
     st.header("🎯 Job Matching")
     
-    if 'candidates_data' not in st.session_state or not st.session_state['candidates_data']:
+    df = get_candidates_df()
+    if df is None:
         st.warning("No candidate data available. Please upload and analyze resumes first.")
         return
     
-    candidates_data = st.session_state['candidates_data']
-    
     col1, col2 = st.columns([1, 1])
     
     with col1:
         st.subheader("📝 Job Requirements")
-        job_title = st.text_input("Job Title", placeholder="e.g., Senior ML Engineer")
-        job_domain = st.selectbox("Domain", ["ML/AI", "Frontend", "Backend", "Data Engineering", "DevOps", "Full Stack"])
-        required_experience = st.slider("Required Experience (years)", 0, 15, 3)
-        
-        required_skills = st.text_area(
-            "Required Skills (comma-separated)", 
-            placeholder="e.g., Python, TensorFlow, Machine Learning, Deep Learning"
-        )
-        
-        job_description = st.text_area(
-            "Job Description",
-            placeholder="Enter detailed job description...",
-            height=150
-        )
+        # Inputs only trigger a rerun when the form is submitted
+        with st.form("job_form"):
+            job_title = st.text_input("Job Title", placeholder="e.g., Senior ML Engineer")
+            job_domain = st.selectbox("Domain", ["ML/AI", "Frontend", "Backend", "Data Engineering", "DevOps", "Full Stack"])
+            required_experience = st.slider("Required Experience (years)", 0, 15, 3)
+            
+            required_skills = st.text_area(
+                "Required Skills (comma-separated)", 
+                placeholder="e.g., Python, TensorFlow, Machine Learning, Deep Learning"
+            )
+            
+            job_description = st.text_area(
+                "Job Description",
+                placeholder="Enter detailed job description...",
+                height=150
+            )
+            
+            submitted = st.form_submit_button("🔍 Find Matching Candidates", type="primary")
         
-        if st.button("🔍 Find Matching Candidates", type="primary"):
+        if submitted:
             if required_skills and job_description:
-                skills_list = [skill.strip() for skill in required_skills.split(',')]
-                
-                # Calculate match scores
-                matched_candidates = []
-                for candidate in candidates_data:
-                    match_score = calculate_match_score(candidate, {
-                        'domain': job_domain,
-                        'required_experience': required_experience,
-                        'required_skills': skills_list,
-                        'job_description': job_description
-                    })
-                    
-                    candidate_with_score = candidate.copy()
-                    candidate_with_score['match_score'] = match_score
-                    matched_candidates.append(candidate_with_score)
+                skills_list = tuple(skill.strip() for skill in required_skills.split(','))
+                job_key = (job_domain, required_experience, skills_list, job_description)
                 
-                # Rank candidates
-                ranked_candidates = rank_candidates(matched_candidates)
-                st.session_state['ranked_candidates'] = ranked_candidates
+                # Score every candidate and keep the top matches
+                st.session_state['ranked_candidates'] = get_ranked_candidates(
+                    st.session_state['candidates_version'], job_key, df
+                )
             else:
                 st.error("Please fill in required skills and job description.")
     
@@ -285,7 +439,7 @@ def job_matching_page():
         if 'ranked_candidates' in st.session_state:
             ranked_candidates = st.session_state['ranked_candidates']
             
-            for i, candidate in enumerate(ranked_candidates[:10]):  # Top 10
+            for i, candidate in enumerate(ranked_candidates[:TOP_MATCHES]):
                 match_percentage = candidate['match_score'] * 100
                 
                 # Color coding for match score
@@ -296,78 +450,139 @@ def job_matching_page():
                 else:
                     color = "🔴"
                 
+                # Expander bodies are sent even while collapsed, so keep each
+                # column down to a single markdown element
                 with st.expander(f"{color} #{i+1} {candidate['name']} - {match_percentage:.1f}% match"):
                     col_a, col_b = st.columns(2)
                     with col_a:
-                        st.write(f"**Domain:** {candidate['domain']}")
-                        st.write(f"**Experience:** {candidate['experience_years']} years")
-                        st.write(f"**Email:** {candidate['email']}")
+                        st.markdown(
+                            f"**Domain:** {candidate['domain']}  \n"
+                            f"**Experience:** {candidate['experience_years']} years  \n"
+                            f"**Email:** {candidate['email']}"
+                        )
                     with col_b:
-                        st.write(f"**Match Score:** {match_percentage:.1f}%")
-                        st.write(f"**Skills:** {', '.join(candidate['skills'][:5])}")
+                        details = (
+                            f"**Match Score:** {match_percentage:.1f}%  \n"
+                            f"**Skills:** {', '.join(candidate['skills'][:5])}"
+                        )
                         if len(candidate['skills']) > 5:
-                            st.write(f"... +{len(candidate['skills']) - 5} more")
+                            details += f"  \n... +{len(candidate['skills']) - 5} more"
+                        st.markdown(details)
+
+@st.cache_data(max_entries=32)
+def get_analytics_data(candidates_version, _candidates_df):
+    """
+    Aggregates behind the analytics charts, as hashable tuples.
+    
+    Cached on candidates_version so the domain and skill counts are computed
+    once per analysis rather than on every visit to the page.
+    """
+    import pyarrow.compute as pc
+    
+    domains = tuple(_candidates_df['domain'])
+    skill_counts = pc.value_counts(pc.list_flatten(pa.array(_candidates_df['skills'])))
+    top_skills = Counter(dict(zip(
+        skill_counts.field('values').to_pylist(),
+        skill_counts.field('counts').to_pylist()
+    ))).most_common(15)
+    # Candidates per distinct experience value, so the histogram needs no re-binning
+    experience_counts = pc.value_counts(pa.array(_candidates_df['experience_years']))
+    experience_histogram = sorted(zip(
+        experience_counts.field('values').to_pylist(),
+        experience_counts.field('counts').to_pylist()
+    ))
+    
+    return {
+        'experience_years': tuple(_candidates_df['experience_years'].tolist()),
+        'experience_histogram': tuple(experience_histogram),
+        'domains': domains,
+        'domain_counts': tuple(Counter(domains).most_common()),
+        'top_skills': tuple(top_skills)
+    }
+
+@st.cache_data(max_entries=16)
+def build_domain_pie(domain_counts):
+    """Pie chart of candidates per domain, cached on the (domain, count) pairs."""
+    import plotly.express as px
+    
+    return px.pie(
+        values=[count for _, count in domain_counts],
+        names=[domain for domain, _ in domain_counts],
+        title="Candidate Distribution by Domain"
+    )
+
+@st.cache_data(max_entries=16)
+def build_experience_histogram(experience_histogram):
+    """Histogram of years of experience, cached on the precomputed (years, count) pairs."""
+    import plotly.express as px
+    
+    fig = px.bar(
+        x=[years for years, _ in experience_histogram],
+        y=[count for _, count in experience_histogram],
+        title="Experience Distribution",
+        labels={'x': 'Years of Experience', 'y': 'Number of Candidates'}
+    )
+    fig.update_layout(bargap=0)
+    return fig
+
+@st.cache_data(max_entries=16)
+def build_skills_bar(top_skills):
+    """Horizontal bar chart of the most common skills, cached on the (skill, count) pairs."""
+    import plotly.express as px
+    
+    fig = px.bar(
+        x=[count for _, count in top_skills],
+        y=[skill for skill, _ in top_skills],
+        orientation='h',
+        title="Top 15 Skills",
+        labels={'x': 'Number of Candidates', 'y': 'Skills'}
+    )
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(max_entries=16)
+def build_experience_scatter(experience_years, domains):
+    """Scatter of experience by domain, cached on the experience and domain values."""
+    import plotly.express as px
+    
+    return px.scatter(
+        x=list(experience_years),
+        y=list(domains),
+        title="Experience by Domain",
+        labels={'x': 'Years of Experience', 'y': 'domain'}
+    )
 
 def analytics_page():
     st.header("📈 Analytics Dashboard")
     
-    if 'candidates_data' not in st.session_state or not st.session_state['candidates_data']:
+    df = get_candidates_df()
+    if df is None:
         st.warning("No candidate data available. Please upload and analyze resumes first.")
         return
     
-    candidates_data = st.session_state['candidates_data']
-    df = pd.DataFrame(candidates_data)
+    # Hashable chart inputs; figures are only rebuilt when these change
+    chart_data = get_analytics_data(st.session_state['candidates_version'], df)
     
     # Charts
     col1, col2 = st.columns(2)
     
     with col1:
         # Domain distribution
-        domain_counts = df['domain'].value_counts()
-        fig_domain = px.pie(
-            values=domain_counts.values,
-            names=domain_counts.index,
-            title="Candidate Distribution by Domain"
-        )
-        st.plotly_chart(fig_domain, use_container_width=True)
+        st.plotly_chart(build_domain_pie(chart_data['domain_counts']), use_container_width=True)
         
         # Experience distribution
-        fig_exp = px.histogram(
-            df, 
-            x='experience_years', 
-            nbins=10,
-            title="Experience Distribution",
-            labels={'experience_years': 'Years of Experience', 'count': 'Number of Candidates'}
-        )
-        st.plotly_chart(fig_exp, use_container_width=True)
+        st.plotly_chart(build_experience_histogram(chart_data['experience_histogram']), use_container_width=True)
     
     with col2:
         # Skills analysis
-        all_skills = []
-        for skills_list in df['skills']:
-            all_skills.extend(skills_list)
+        st.plotly_chart(build_skills_bar(chart_data['top_skills']), use_container_width=True)
         
-        skill_counts = pd.Series(all_skills).value_counts().head(15)
-        
-        fig_skills = px.bar(
-            x=skill_counts.values,
-            y=skill_counts.index,
-            orientation='h',
-            title="Top 15 Skills",
-            labels={'x': 'Number of Candidates', 'y': 'Skills'}
-        )
-        fig_skills.update_layout(height=500)
-        st.plotly_chart(fig_skills, use_container_width=True)
-        
-        # Experience vs Domain
-        fig_scatter = px.scatter(
-            df, 
-            x='experience_years', 
-            y='domain',
-            title="Experience by Domain",
-            labels={'experience_years': 'Years of Experience'}
-        )
-        st.plotly_chart(fig_scatter, use_container_width=True)
+        # Experience vs Domain (one point per candidate, so only built on request)
+        if st.toggle("Show experience by domain", key="show_experience_scatter"):
+            st.plotly_chart(
+                build_experience_scatter(chart_data['experience_years'], chart_data['domains']),
+                use_container_width=True
+            )
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -7,6 +7,7 @@ This script starts the Streamlit application with proper error handling.
 import subprocess
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_virtual_environment():
@@ -21,13 +22,8 @@ def check_virtual_environment():
 def check_dependencies():
     """Check if required dependencies are installed."""
     required_packages = ['streamlit', 'pandas', 'plotly', 'pdfplumber','nltk','spacy']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # Look the packages up without importing them (spacy alone takes seconds)
+    missing_packages = [package for package in required_packages if find_spec(package) is None]
     
     if missing_packages:
         print(f"❌ Missing required packages: {', '.join(missing_packages)}")
@@ -1,66 +1,187 @@
 import re
+import heapq
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 from collections import Counter
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: multi-skill search falls back to substring scans
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Related domains (lowercased) that earn a partial domain match
+DOMAIN_RELATIONSHIPS = {
+    'ml/ai': frozenset({'data engineering', 'backend'}),
+    'data engineering': frozenset({'ml/ai', 'backend'}),
+    'frontend': frozenset({'full stack'}),
+    'backend': frozenset({'full stack', 'devops', 'ml/ai'}),
+    'devops': frozenset({'backend', 'cloud'}),
+    'full stack': frozenset({'frontend', 'backend'}),
+    'mobile': frozenset({'frontend'})
+}
+
+# Domains covered by a full-stack role
+FULL_STACK_PARTS = frozenset({'frontend', 'backend'})
+
+# Experience ratio thresholds and the score for each band between them:
+# below 0.2 scores 0.1, [0.2, 0.4) scores 0.3, ... and 1.0 or more scores 1.0
+EXPERIENCE_RATIO_THRESHOLDS = (0.2, 0.4, 0.6, 0.8, 1.0)
+EXPERIENCE_RATIO_SCORES = (0.1, 0.3, 0.5, 0.7, 0.9, 1.0)
+
+# Education levels in ascending order, for minimum-education filters
+EDUCATION_HIERARCHY = {'certificate': 1, 'associate': 2, 'bachelors': 3, 'masters': 4, 'phd': 5}
+
+# Weight of each component in the overall match score
+MATCH_WEIGHTS = {
+    'domain_match': 0.3,
+    'skills_match': 0.4,
+    'experience_match': 0.2,
+    'text_similarity': 0.1
+}
+
+def prepare_job_requirements(job_requirements: Dict) -> Dict:
+    """
+    Precompute the normalized job fields that every candidate is scored against.
+    
+    Call this once before scoring many candidates so the required skills and
+    job description are not re-normalized per candidate.
+    
+    Args:
+        job_requirements (Dict): Job requirements
+        
+    Returns:
+        Dict: Copy of the job requirements with normalized fields added
+    """
+    prepared = dict(job_requirements)
+    prepared['required_skills_lower'] = [
+        skill.lower().strip() for skill in job_requirements.get('required_skills', [])
+    ]
+    prepared['required_skills_automaton'] = build_skills_automaton(prepared['required_skills_lower'])
+    prepared['job_description_lower'] = job_requirements.get('job_description', '').lower()
+    return prepared
+
+def build_skills_automaton(skills_lower: List[str]):
+    """
+    Build an Aho-Corasick automaton that finds all the given skills in one pass.
+    
+    Args:
+        skills_lower (List[str]): Normalized skills to search for
+        
+    Returns:
+        ahocorasick.Automaton: Automaton yielding the matched skills, or None
+            if pyahocorasick is not installed or there is nothing to search for
+    """
+    words = [skill for skill in skills_lower if skill]
+    if ahocorasick is None or not words:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for skill in words:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+def find_keywords_in_text(keywords_lower, text_lower: str) -> set:
+    """
+    Find which of the given keywords occur in a text.
+    
+    Each distinct keyword is looked up once, and with pyahocorasick installed
+    the text is scanned a single time for all of them. An automaton is built on
+    every call, so use it once per job (as find_best_matches does), not per
+    candidate.
+    
+    Args:
+        keywords_lower: Normalized keywords to look for
+        text_lower (str): Lowercased text to search
+        
+    Returns:
+        set: The keywords that occur in the text
+    """
+    words = {keyword for keyword in keywords_lower if keyword}
+    automaton = build_skills_automaton(words)
+    if automaton is not None:
+        return {keyword for _, keyword in automaton.iter(text_lower)}
+    return {keyword for keyword in words if keyword in text_lower}
+
 def calculate_match_score(candidate: Dict, job_requirements: Dict) -> float:
     """
     Calculate match score between candidate and job requirements.
     
     Args:
         candidate (Dict): Candidate profile
-        job_requirements (Dict): Job requirements
+        job_requirements (Dict): Job requirements, optionally prepared with
+            prepare_job_requirements()
         
     Returns:
         float: Match score between 0 and 1
     """
-    scores = []
-    weights = {
-        'domain_match': 0.3,
-        'skills_match': 0.4,
-        'experience_match': 0.2,
-        'text_similarity': 0.1
-    }
-    
     # Domain match score
     domain_score = calculate_domain_match(
         candidate.get('domain', 'General'),
         job_requirements.get('domain', 'General')
     )
-    scores.append(('domain_match', domain_score))
     
     # Skills match score
     skills_score = calculate_skills_match(
         candidate.get('skills', []),
-        job_requirements.get('required_skills', [])
+        job_requirements.get('required_skills', []),
+        job_requirements.get('required_skills_lower'),
+        job_requirements.get('required_skills_automaton'),
+        candidate.get('skills_lc')
     )
-    scores.append(('skills_match', skills_score))
     
     # Experience match score
     experience_score = calculate_experience_match(
         candidate.get('experience_years', 0),
         job_requirements.get('required_experience', 0)
     )
-    scores.append(('experience_match', experience_score))
     
     # Text similarity score (basic keyword matching)
     text_score = calculate_text_similarity(
         candidate.get('skills', []) + [candidate.get('domain', '')],
-        job_requirements.get('job_description', '')
+        job_requirements.get('job_description', ''),
+        job_requirements.get('job_description_lower'),
+        job_requirements.get('job_description_keywords')
     )
-    scores.append(('text_similarity', text_score))
     
+    return combine_match_scores(domain_score, skills_score, experience_score, text_score)
+
+def combine_match_scores(domain_score: float, skills_score: float,
+                         experience_score: float, text_score: float) -> float:
+    """
+    Combine the component scores into the overall match score.
+    
+    Args:
+        domain_score (float): Domain match score (0-1)
+        skills_score (float): Skills match score (0-1)
+        experience_score (float): Experience match score (0-1)
+        text_score (float): Text similarity score (0-1)
+        
+    Returns:
+        float: Match score between 0 and 1
+    """
     # Calculate weighted average
-    total_score = sum(score * weights.get(category, 0.25) for category, score in scores)
+    total_score = (
+        domain_score * MATCH_WEIGHTS['domain_match'] +
+        skills_score * MATCH_WEIGHTS['skills_match'] +
+        experience_score * MATCH_WEIGHTS['experience_match'] +
+        text_score * MATCH_WEIGHTS['text_similarity']
+    )
     
     return min(max(total_score, 0.0), 1.0)  # Ensure score is between 0 and 1
 
+@lru_cache(maxsize=256)
 def calculate_domain_match(candidate_domain: str, required_domain: str) -> float:
     """
     Calculate domain match score.
     
+    Domains come from a small fixed set, so scores are memoized per pair.
+    
     Args:
         candidate_domain (str): Candidate's primary domain
         required_domain (str): Required domain for the job
@@ -78,42 +199,37 @@ def calculate_domain_match(candidate_domain: str, required_domain: str) -> float
     if candidate_domain == required_domain:
         return 1.0
     
-    # Related domains scoring
-    domain_relationships = {
-        'ml/ai': ['data engineering', 'backend'],
-        'data engineering': ['ml/ai', 'backend'],
-        'frontend': ['full stack'],
-        'backend': ['full stack', 'devops', 'ml/ai'],
-        'devops': ['backend', 'cloud'],
-        'full stack': ['frontend', 'backend'],
-        'mobile': ['frontend']
-    }
-    
     # Check if domains are related
-    related_domains = domain_relationships.get(required_domain, [])
-    if candidate_domain in related_domains:
+    if candidate_domain in DOMAIN_RELATIONSHIPS.get(required_domain, ()):
         return 0.7
     
     # Check reverse relationship
-    related_domains = domain_relationships.get(candidate_domain, [])
-    if required_domain in related_domains:
+    if required_domain in DOMAIN_RELATIONSHIPS.get(candidate_domain, ()):
         return 0.7
     
     # Partial matches
-    if 'full stack' in candidate_domain and required_domain in ['frontend', 'backend']:
+    if 'full stack' in candidate_domain and required_domain in FULL_STACK_PARTS:
         return 0.8
-    if 'full stack' in required_domain and candidate_domain in ['frontend', 'backend']:
+    if 'full stack' in required_domain and candidate_domain in FULL_STACK_PARTS:
         return 0.8
     
     return 0.2  # Low score for unrelated domains
 
-def calculate_skills_match(candidate_skills: List[str], required_skills: List[str]) -> float:
+def calculate_skills_match(candidate_skills: List[str], required_skills: List[str],
+                           required_skills_lower: Optional[List[str]] = None,
+                           required_skills_automaton=None,
+                           candidate_skills_lower: Optional[List[str]] = None) -> float:
     """
     Calculate skills match score.
     
     Args:
         candidate_skills (List[str]): Candidate's skills
         required_skills (List[str]): Required skills for the job
+        required_skills_lower (Optional[List[str]]): Pre-normalized required skills
+        required_skills_automaton: Automaton over the normalized required skills,
+            from build_skills_automaton()
+        candidate_skills_lower (Optional[List[str]]): Pre-normalized candidate
+            skills (the candidate's 'skills_lc')
         
     Returns:
         float: Skills match score (0-1)
@@ -125,29 +241,45 @@ def calculate_skills_match(candidate_skills: List[str], required_skills: List[st
         return 0.0
     
     # Normalize skills for comparison
-    candidate_skills_lower = [skill.lower().strip() for skill in candidate_skills]
-    required_skills_lower = [skill.lower().strip() for skill in required_skills]
+    if candidate_skills_lower is None:
+        candidate_skills_lower = [skill.lower().strip() for skill in candidate_skills]
+    candidate_skills_set = set(candidate_skills_lower)
+    if required_skills_lower is None:
+        required_skills_lower = [skill.lower().strip() for skill in required_skills]
+    
+    # Required skills that occur inside some candidate skill, found in a single
+    # scan of all candidate skills (NUL-separated so matches cannot span skills)
+    contained_skills = None
+    if required_skills_automaton is not None:
+        contained_skills = {
+            skill for _, skill in required_skills_automaton.iter("\x00".join(candidate_skills_lower))
+        }
     
     # Exact matches
     exact_matches = 0
     partial_matches = 0
     
     for required_skill in required_skills_lower:
-        found_exact = False
-        
         # Check for exact matches
-        for candidate_skill in candidate_skills_lower:
-            if required_skill == candidate_skill:
-                exact_matches += 1
-                found_exact = True
-                break
+        if required_skill in candidate_skills_set:
+            exact_matches += 1
+            continue
         
         # Check for partial matches if no exact match found
-        if not found_exact:
-            for candidate_skill in candidate_skills_lower:
-                if (required_skill in candidate_skill or candidate_skill in required_skill) and len(required_skill) > 2:
-                    partial_matches += 1
-                    break
+        if len(required_skill) <= 2:
+            continue
+        if contained_skills is not None:
+            partial = required_skill in contained_skills or any(
+                candidate_skill in required_skill for candidate_skill in candidate_skills_lower
+            )
+        else:
+            # Without the automaton, test both directions in one pass over the skills
+            partial = any(
+                required_skill in candidate_skill or candidate_skill in required_skill
+                for candidate_skill in candidate_skills_lower
+            )
+        if partial:
+            partial_matches += 1
     
     # Calculate score
     total_matches = exact_matches + (partial_matches * 0.5)
@@ -175,27 +307,23 @@ def calculate_experience_match(candidate_experience: int, required_experience: i
     # Calculate ratio
     ratio = candidate_experience / required_experience
     
-    # Scoring based on ratio
-    if ratio >= 1.0:
-        return 1.0  # Meets or exceeds requirement
-    elif ratio >= 0.8:
-        return 0.9  # Close to requirement
-    elif ratio >= 0.6:
-        return 0.7  # Somewhat below requirement
-    elif ratio >= 0.4:
-        return 0.5  # Significantly below requirement
-    elif ratio >= 0.2:
-        return 0.3  # Far below requirement
-    else:
-        return 0.1  # Very far below requirement
+    # Score the band the ratio falls in (one bisect instead of an elif ladder)
+    return EXPERIENCE_RATIO_SCORES[bisect_right(EXPERIENCE_RATIO_THRESHOLDS, ratio)]
 
-def calculate_text_similarity(candidate_keywords: List[str], job_description: str) -> float:
+def calculate_text_similarity(candidate_keywords: List[str], job_description: str,
+                              job_description_lower: Optional[str] = None,
+                              job_description_keywords: Optional[set] = None) -> float:
     """
     Calculate text similarity score using keyword matching.
     
     Args:
         candidate_keywords (List[str]): Keywords from candidate profile
         job_description (str): Job description text
+        job_description_lower (Optional[str]): Pre-lowercased job description
+        job_description_keywords (Optional[set]): Lowercased keywords already
+            found in the job description (from find_keywords_in_text), covering
+            at least this candidate's keywords; without it the description is
+            searched directly
         
     Returns:
         float: Text similarity score (0-1)
@@ -203,28 +331,39 @@ def calculate_text_similarity(candidate_keywords: List[str], job_description: st
     if not job_description or not candidate_keywords:
         return 0.0
     
-    job_description_lower = job_description.lower()
     matches = 0
     
-    for keyword in candidate_keywords:
-        if keyword and keyword.lower() in job_description_lower:
-            matches += 1
+    if job_description_keywords is not None:
+        # Keywords were already searched for once for the whole job
+        for keyword in candidate_keywords:
+            if keyword and keyword.lower() in job_description_keywords:
+                matches += 1
+    else:
+        if job_description_lower is None:
+            job_description_lower = job_description.lower()
+        for keyword in candidate_keywords:
+            if keyword and keyword.lower() in job_description_lower:
+                matches += 1
     
     if len(candidate_keywords) == 0:
         return 0.0
     
     return matches / len(candidate_keywords)
 
-def rank_candidates(candidates_with_scores: List[Dict]) -> List[Dict]:
+def rank_candidates(candidates_with_scores: List[Dict], top_n: Optional[int] = None) -> List[Dict]:
     """
     Rank candidates by their match scores.
     
     Args:
         candidates_with_scores (List[Dict]): List of candidates with match scores
+        top_n (Optional[int]): Only return the best N candidates (partial sort)
         
     Returns:
         List[Dict]: Ranked list of candidates (highest score first)
     """
+    if top_n is not None:
+        return heapq.nlargest(top_n, candidates_with_scores, key=lambda x: x.get('match_score', 0))
+    
     return sorted(
         candidates_with_scores,
         key=lambda x: x.get('match_score', 0),
@@ -243,17 +382,25 @@ def find_best_matches(candidates: List[Dict], job_requirements: Dict, top_n: int
     Returns:
         List[Dict]: Top matching candidates with scores
     """
-    candidates_with_scores = []
+    job_requirements = prepare_job_requirements(job_requirements)
     
-    for candidate in candidates:
-        match_score = calculate_match_score(candidate, job_requirements)
-        candidate_with_score = candidate.copy()
-        candidate_with_score['match_score'] = match_score
-        candidates_with_scores.append(candidate_with_score)
-    
-    # Rank and return top N
-    ranked_candidates = rank_candidates(candidates_with_scores)
-    return ranked_candidates[:top_n]
+    # Search the job description once for every distinct candidate keyword
+    # instead of once per keyword per candidate
+    if job_requirements.get('job_description'):
+        candidate_keywords = set()
+        for candidate in candidates:
+            candidate_keywords.update(skill.lower() for skill in candidate.get('skills', []) if skill)
+            if candidate.get('domain'):
+                candidate_keywords.add(candidate['domain'].lower())
+        job_requirements['job_description_keywords'] = find_keywords_in_text(
+            candidate_keywords, job_requirements['job_description_lower']
+        )
+    
+    scored = [(calculate_match_score(candidate, job_requirements), candidate) for candidate in candidates]
+    
+    # Partial sort, then copy only the candidates that are returned
+    top_scored = heapq.nlargest(top_n, scored, key=itemgetter(0))
+    return [dict(candidate, match_score=score) for score, candidate in top_scored]
 
 def analyze_match_details(candidate: Dict, job_requirements: Dict) -> Dict:
     """
@@ -267,7 +414,7 @@ def analyze_match_details(candidate: Dict, job_requirements: Dict) -> Dict:
         Dict: Detailed match analysis
     """
     analysis = {
-        'overall_score': calculate_match_score(candidate, job_requirements),
+        'overall_score': 0.0,  # Combined from the component scores below
         'domain_analysis': {},
         'skills_analysis': {},
         'experience_analysis': {},
@@ -295,22 +442,31 @@ def analyze_match_details(candidate: Dict, job_requirements: Dict) -> Dict:
     matched_skills = []
     missing_skills = []
     
+    # Lowercase each candidate skill once rather than once per required skill
+    candidate_skills_lower = [skill.lower() for skill in candidate_skills]
+    
     for req_skill in required_skills:
-        found = False
-        for cand_skill in candidate_skills:
-            if req_skill.lower() in cand_skill.lower() or cand_skill.lower() in req_skill.lower():
-                matched_skills.append(req_skill)
-                found = True
-                break
-        if not found:
+        req_skill_lower = req_skill.lower()
+        if any(req_skill_lower in cand_skill or cand_skill in req_skill_lower
+               for cand_skill in candidate_skills_lower):
+            matched_skills.append(req_skill)
+        else:
             missing_skills.append(req_skill)
     
-    skills_score = calculate_skills_match(candidate_skills, required_skills)
+    # Reuse any normalized fields already on the candidate and the job
+    skills_score = calculate_skills_match(
+        candidate_skills,
+        required_skills,
+        job_requirements.get('required_skills_lower'),
+        job_requirements.get('required_skills_automaton'),
+        candidate.get('skills_lc')
+    )
+    matched_skills_set = set(matched_skills)
     analysis['skills_analysis'] = {
         'score': skills_score,
         'matched_skills': matched_skills,
         'missing_skills': missing_skills,
-        'additional_skills': [skill for skill in candidate_skills if skill not in matched_skills],
+        'additional_skills': [skill for skill in candidate_skills if skill not in matched_skills_set],
         'match_level': get_match_level(skills_score)
     }
     
@@ -326,6 +482,15 @@ def analyze_match_details(candidate: Dict, job_requirements: Dict) -> Dict:
         'match_level': get_match_level(exp_score)
     }
     
+    # Overall score from the components above, rather than scoring them all again
+    text_score = calculate_text_similarity(
+        candidate_skills + [candidate.get('domain', '')],
+        job_requirements.get('job_description', ''),
+        job_requirements.get('job_description_lower'),
+        job_requirements.get('job_description_keywords')
+    )
+    analysis['overall_score'] = combine_match_scores(domain_score, skills_score, exp_score, text_score)
+    
     # Identify strengths and gaps
     if domain_score >= 0.7:
         analysis['strengths'].append(f"Strong domain match ({candidate.get('domain', 'General')})")
@@ -386,36 +551,35 @@ def filter_candidates_by_criteria(candidates: List[Dict], filters: Dict) -> List
     Returns:
         List[Dict]: Filtered candidates
     """
-    filtered_candidates = candidates.copy()
-    
-    # Filter by minimum experience
-    if 'min_experience' in filters:
-        min_exp = filters['min_experience']
-        filtered_candidates = [c for c in filtered_candidates if c.get('experience_years', 0) >= min_exp]
-    
-    # Filter by domain
-    if 'domains' in filters and filters['domains']:
-        domains = [d.lower() for d in filters['domains']]
-        filtered_candidates = [c for c in filtered_candidates if c.get('domain', '').lower() in domains]
-    
-    # Filter by required skills
-    if 'must_have_skills' in filters and filters['must_have_skills']:
-        must_have = [s.lower() for s in filters['must_have_skills']]
-        filtered_candidates = []
-        for candidate in candidates:
-            candidate_skills = [s.lower() for s in candidate.get('skills', [])]
-            if any(skill in ' '.join(candidate_skills) for skill in must_have):
-                filtered_candidates.append(candidate)
-    
-    # Filter by education level
+    # Normalize each criterion once, then test every candidate in a single pass
+    min_exp = filters.get('min_experience')
+    domains = {d.lower() for d in filters['domains']} if filters.get('domains') else None
+    must_have = [s.lower() for s in filters['must_have_skills']] if filters.get('must_have_skills') else None
+    min_edu_level = None
     if 'min_education' in filters:
-        education_hierarchy = {'certificate': 1, 'associate': 2, 'bachelors': 3, 'masters': 4, 'phd': 5}
-        min_edu_level = education_hierarchy.get(filters['min_education'].lower(), 0)
+        min_edu_level = EDUCATION_HIERARCHY.get(filters['min_education'].lower(), 0)
+    
+    filtered_candidates = []
+    for candidate in candidates:
+        # Filter by minimum experience
+        if min_exp is not None and candidate.get('experience_years', 0) < min_exp:
+            continue
+        
+        # Filter by domain
+        if domains is not None and candidate.get('domain', '').lower() not in domains:
+            continue
+        
+        # Filter by required skills (any of them, anywhere in the candidate's skills)
+        if must_have is not None:
+            candidate_skills = ' '.join(s.lower() for s in candidate.get('skills', []))
+            if not any(skill in candidate_skills for skill in must_have):
+                continue
+        
+        # Filter by education level
+        if min_edu_level is not None and EDUCATION_HIERARCHY.get(candidate.get('education', '').lower(), 0) < min_edu_level:
+            continue
         
-        filtered_candidates = [
-            c for c in filtered_candidates 
-            if education_hierarchy.get(c.get('education', '').lower(), 0) >= min_edu_level
-        ]
+        filtered_candidates.append(candidate)
     
     return filtered_candidates
 
@@ -5,6 +5,78 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables and patterns are built once at import, not per resume
+
+# Domain classification rules based on skills
+DOMAIN_KEYWORDS = {
+    'ML/AI': [
+        'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras',
+        'scikit-learn', 'neural networks', 'nlp', 'computer vision', 'ai',
+        'transformers', 'bert', 'gpt', 'opencv', 'pandas', 'numpy', 'ml'
+    ],
+    'Data Engineering': [
+        'hadoop', 'spark', 'kafka', 'airflow', 'etl', 'data pipeline',
+        'snowflake', 'databricks', 'big data', 'data warehouse', 'data lake',
+        'apache spark', 'hive', 'pig', 'scala', 'sql'
+    ],
+    'Frontend': [
+        'react', 'angular', 'vue', 'javascript', 'typescript', 'html', 'css',
+        'sass', 'less', 'webpack', 'babel', 'npm', 'yarn', 'jquery', 'bootstrap',
+        'tailwind', 'next.js', 'nuxt.js', 'svelte'
+    ],
+    'Backend': [
+        'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
+        'laravel', 'rails', 'asp.net', 'php', 'java', 'python', 'c#', 'go', 'rust'
+    ],
+    'DevOps': [
+        'docker', 'kubernetes', 'jenkins', 'gitlab ci', 'github actions',
+        'terraform', 'ansible', 'chef', 'puppet', 'aws', 'azure', 'gcp',
+        'linux', 'bash', 'shell scripting', 'monitoring'
+    ],
+    'Mobile': [
+        'ios', 'android', 'swift', 'kotlin', 'react native', 'flutter',
+        'xamarin', 'ionic', 'cordova', 'mobile development'
+    ],
+    'Full Stack': [
+        'full stack', 'fullstack', 'mean', 'mern', 'lamp', 'django + react',
+        'node + react'
+    ]
+}
+
+# One alternation per domain, used to skip skills that contain none of its keywords
+DOMAIN_KEYWORD_PATTERNS = {
+    domain: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    for domain, keywords in DOMAIN_KEYWORDS.items()
+}
+
+# Patterns to find years of experience mentions
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\s*(?:\+)?\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'(\d+)\s*(?:\+)?\s*yrs?\s+(?:of\s+)?experience'),
+    re.compile(r'experience\s+(?:of\s+)?(\d+)\s*(?:\+)?\s*years?'),
+    re.compile(r'(\d+)\s*(?:\+)?\s*years?\s+in\s+'),
+]
+
+# Job titles used to estimate experience when no explicit mention exists
+JOB_TITLE_PATTERN = re.compile(r'\b(?:engineer|developer|analyst|manager|lead|senior|principal)\b')
+
+EDUCATION_LEVELS = {
+    'phd': ['phd', 'ph.d', 'doctorate', 'doctoral'],
+    'masters': ['master', 'm.s', 'ms', 'm.a', 'ma', 'mba', 'm.tech', 'mtech'],
+    'bachelors': ['bachelor', 'b.s', 'bs', 'b.a', 'ba', 'b.tech', 'btech', 'be'],
+    'associate': ['associate', 'diploma'],
+    'certificate': ['certificate', 'certification']
+}
+
+# Additional skill patterns to look for
+ADDITIONAL_SKILL_PATTERNS = {
+    'Version Control': re.compile(r'\b(git|github|gitlab|bitbucket|svn|mercurial)\b'),
+    'Databases': re.compile(r'\b(mysql|postgresql|mongodb|redis|oracle|sql server|sqlite)\b'),
+    'Cloud Platforms': re.compile(r'\b(aws|azure|gcp|google cloud|amazon web services)\b'),
+    'Testing': re.compile(r'\b(unit test|integration test|pytest|jest|selenium|cypress)\b'),
+    'Methodologies': re.compile(r'\b(agile|scrum|kanban|devops|ci/cd|tdd|bdd)\b')
+}
+
 def analyze_candidate_profile(resume_data: Dict) -> Dict:
     """
     Analyze candidate profile and extract key information.
@@ -58,53 +130,18 @@ def classify_domain(skills: List[str]) -> str:
     if not skills:
         return "General"
     
-    # Domain classification rules based on skills
-    domain_keywords = {
-        'ML/AI': [
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras',
-            'scikit-learn', 'neural networks', 'nlp', 'computer vision', 'ai',
-            'transformers', 'bert', 'gpt', 'opencv', 'pandas', 'numpy', 'ml'
-        ],
-        'Data Engineering': [
-            'hadoop', 'spark', 'kafka', 'airflow', 'etl', 'data pipeline',
-            'snowflake', 'databricks', 'big data', 'data warehouse', 'data lake',
-            'apache spark', 'hive', 'pig', 'scala', 'sql'
-        ],
-        'Frontend': [
-            'react', 'angular', 'vue', 'javascript', 'typescript', 'html', 'css',
-            'sass', 'less', 'webpack', 'babel', 'npm', 'yarn', 'jquery', 'bootstrap',
-            'tailwind', 'next.js', 'nuxt.js', 'svelte'
-        ],
-        'Backend': [
-            'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
-            'laravel', 'rails', 'asp.net', 'php', 'java', 'python', 'c#', 'go', 'rust'
-        ],
-        'DevOps': [
-            'docker', 'kubernetes', 'jenkins', 'gitlab ci', 'github actions',
-            'terraform', 'ansible', 'chef', 'puppet', 'aws', 'azure', 'gcp',
-            'linux', 'bash', 'shell scripting', 'monitoring'
-        ],
-        'Mobile': [
-            'ios', 'android', 'swift', 'kotlin', 'react native', 'flutter',
-            'xamarin', 'ionic', 'cordova', 'mobile development'
-        ],
-        'Full Stack': [
-            'full stack', 'fullstack', 'mean', 'mern', 'lamp', 'django + react',
-            'node + react'
-        ]
-    }
-    
     # Convert skills to lowercase for matching
     skills_lower = [skill.lower() for skill in skills]
     
     # Calculate scores for each domain
     domain_scores = {}
-    for domain, keywords in domain_keywords.items():
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        pattern = DOMAIN_KEYWORD_PATTERNS[domain]
         score = 0
-        for keyword in keywords:
-            for skill in skills_lower:
-                if keyword in skill:
-                    score += 1
+        for skill in skills_lower:
+            # Count the keywords contained in the skill, if it contains any
+            if pattern.search(skill):
+                score += sum(1 for keyword in keywords if keyword in skill)
         domain_scores[domain] = score
     
     # Find the domain with highest score
@@ -133,19 +170,11 @@ def calculate_experience_years_from_text(text: str) -> int:
     if not text:
         return 0
     
-    # Pattern to find years of experience mentions
-    experience_patterns = [
-        r'(\d+)\s*(?:\+)?\s*years?\s+(?:of\s+)?experience',
-        r'(\d+)\s*(?:\+)?\s*yrs?\s+(?:of\s+)?experience',
-        r'experience\s+(?:of\s+)?(\d+)\s*(?:\+)?\s*years?',
-        r'(\d+)\s*(?:\+)?\s*years?\s+in\s+',
-    ]
-    
     years_found = []
     text_lower = text.lower()
     
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, text_lower)
+    for pattern in EXPERIENCE_PATTERNS:
+        matches = pattern.findall(text_lower)
         for match in matches:
             try:
                 years = int(match)
@@ -158,10 +187,7 @@ def calculate_experience_years_from_text(text: str) -> int:
         return max(years_found)  # Take the highest mentioned experience
     
     # Fallback: estimate from job positions (rough heuristic)
-    job_keywords = ['engineer', 'developer', 'analyst', 'manager', 'lead', 'senior', 'principal']
-    job_count = 0
-    for keyword in job_keywords:
-        job_count += len(re.findall(r'\b' + keyword + r'\b', text_lower))
+    job_count = len(JOB_TITLE_PATTERN.findall(text_lower))
     
     # Estimate 2 years per job position, capped at 15
     estimated_years = min(job_count * 2, 15)
@@ -180,19 +206,11 @@ def analyze_education_level(education_data: List[Dict]) -> str:
     if not education_data:
         return "Not specified"
     
-    education_levels = {
-        'phd': ['phd', 'ph.d', 'doctorate', 'doctoral'],
-        'masters': ['master', 'm.s', 'ms', 'm.a', 'ma', 'mba', 'm.tech', 'mtech'],
-        'bachelors': ['bachelor', 'b.s', 'bs', 'b.a', 'ba', 'b.tech', 'btech', 'be'],
-        'associate': ['associate', 'diploma'],
-        'certificate': ['certificate', 'certification']
-    }
-    
     # Check each education entry
     for edu in education_data:
         degree_text = edu.get('degree', '').lower()
         
-        for level, keywords in education_levels.items():
+        for level, keywords in EDUCATION_LEVELS.items():
             for keyword in keywords:
                 if keyword in degree_text:
                     return level.title()
@@ -212,18 +230,9 @@ def enhance_skills_extraction(base_skills: List[str], text: str) -> List[str]:
     """
     enhanced_skills = list(set(base_skills))  # Remove duplicates
     
-    # Additional skill patterns to look for
-    additional_patterns = {
-        'Version Control': r'\b(git|github|gitlab|bitbucket|svn|mercurial)\b',
-        'Databases': r'\b(mysql|postgresql|mongodb|redis|oracle|sql server|sqlite)\b',
-        'Cloud Platforms': r'\b(aws|azure|gcp|google cloud|amazon web services)\b',
-        'Testing': r'\b(unit test|integration test|pytest|jest|selenium|cypress)\b',
-        'Methodologies': r'\b(agile|scrum|kanban|devops|ci/cd|tdd|bdd)\b'
-    }
-    
     text_lower = text.lower()
-    for category, pattern in additional_patterns.items():
-        matches = re.findall(pattern, text_lower)
+    for category, pattern in ADDITIONAL_SKILL_PATTERNS.items():
+        matches = pattern.findall(text_lower)
         for match in matches:
             skill_name = match.title()
             if skill_name not in enhanced_skills:
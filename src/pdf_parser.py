@@ -1,55 +1,219 @@
 import pdfplumber
+from PyPDF2 import PdfReader
 import re
+import io
 import os
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional, Union
 import logging
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # Optional: enables the 'pymupdf' parser backend
+    fitz = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def extract_resume_data(pdf_path: str) -> Dict:
+# A PDF can be given as a path, raw bytes or a binary file-like object
+PdfSource = Union[str, bytes, bytearray, IO[bytes]]
+
+# Text extractors that can be requested; 'auto' is pdfplumber with a PyPDF2 fallback
+PARSER_BACKENDS = ('auto', 'pdfplumber', 'pypdf2', 'pymupdf')
+
+# Extractors tried in order by 'auto', and after a requested backend finds no text
+FALLBACK_BACKENDS = ('pdfplumber', 'pypdf2')
+
+# Common technical skills database
+SKILLS_DATABASE = {
+    'programming_languages': [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust',
+        'kotlin', 'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell',
+        'bash', 'powershell', 'sql', 'html', 'css', 'sass', 'less'
+    ],
+    'ml_ai': [
+        'machine learning', 'deep learning', 'neural networks', 'tensorflow', 'pytorch',
+        'keras', 'scikit-learn', 'pandas', 'numpy', 'opencv', 'nlp', 'computer vision',
+        'reinforcement learning', 'transformers', 'bert', 'gpt', 'llm', 'ai', 'ml'
+    ],
+    'web_frameworks': [
+        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'fastapi',
+        'spring', 'spring boot', 'laravel', 'rails', 'asp.net', 'next.js', 'nuxt.js'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
+        'oracle', 'sql server', 'sqlite', 'firebase', 'dynamodb', 'neo4j'
+    ],
+    'cloud_devops': [
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab ci',
+        'github actions', 'terraform', 'ansible', 'chef', 'puppet', 'vagrant'
+    ],
+    'tools': [
+        'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack',
+        'postman', 'swagger', 'figma', 'adobe', 'photoshop', 'illustrator'
+    ],
+    'data_engineering': [
+        'hadoop', 'spark', 'kafka', 'airflow', 'snowflake', 'databricks',
+        'etl', 'data pipeline', 'big data', 'data warehouse', 'data lake'
+    ]
+}
+
+# Word-bounded pattern and display name for every known skill, compiled once
+SKILL_PATTERNS = [
+    (re.compile(r'\b' + re.escape(skill.lower()) + r'\b'), skill.title())
+    for skills_list in SKILLS_DATABASE.values()
+    for skill in skills_list
+]
+
+def extract_resume_data(pdf_source: PdfSource) -> Dict:
     """
     Extract structured data from a resume PDF file.
     
     Args:
-        pdf_path (str): Path to the PDF file
+        pdf_source (PdfSource): Path, bytes or binary file-like object of the PDF
         
     Returns:
         Dict: Structured resume data
     """
+    source_name = describe_source(pdf_source)
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            # Extract all text from PDF
-            full_text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    full_text += page_text + "\n"
-            
-            if not full_text.strip():
-                logger.warning(f"No text extracted from {pdf_path}")
-                return {"raw_text": "", "error": "No text found in PDF"}
-            
-            # Extract structured information
-            resume_data = {
-                "raw_text": full_text,
-                "name": extract_name(full_text),
-                "email": extract_email(full_text),
-                "phone": extract_phone(full_text),
-                "skills": extract_skills(full_text),
-                "experience": extract_experience(full_text),
-                "education": extract_education(full_text),
-                "linkedin": extract_linkedin(full_text)
-            }
-            
-            logger.info(f"Successfully extracted data from {pdf_path}")
-            return resume_data
+        with pdfplumber.open(open_source(pdf_source)) as pdf:
+            full_text = extract_text_pdfplumber(pdf)
+        return build_resume_data(full_text, source_name)
             
     except Exception as e:
-        logger.error(f"Error extracting data from {pdf_path}: {str(e)}")
+        logger.error(f"Error extracting data from {source_name}: {str(e)}")
         return {"raw_text": "", "error": str(e)}
 
+def extract_resume_data_smart(pdf_source: PdfSource, backend: str = 'auto') -> Dict:
+    """
+    Extract structured data from a resume PDF with a choice of text extractor.
+    
+    By default pdfplumber's layout-aware extraction is used, as in
+    extract_resume_data(); PyPDF2 is only tried when pdfplumber finds no text.
+    
+    Args:
+        pdf_source (PdfSource): Path, bytes or binary file-like object of the PDF
+        backend (str): One of PARSER_BACKENDS; a specific backend is tried
+            first and FALLBACK_BACKENDS are tried if it finds no text
+        
+    Returns:
+        Dict: Structured resume data
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if backend == 'pymupdf' and fitz is None:
+        logger.warning("PyMuPDF is not installed, using automatic parser selection")
+        backend = 'auto'
+    
+    source_name = describe_source(pdf_source)
+    try:
+        # Try the requested backend, then the fallbacks, running each at most once
+        tried = set()
+        full_text = ""
+        for name in (backend,) + FALLBACK_BACKENDS:
+            if name == 'auto' or name in tried:
+                continue
+            tried.add(name)
+            full_text = extract_text_with_backend(pdf_source, name)
+            if full_text.strip():
+                break
+        
+        return build_resume_data(full_text, source_name)
+    
+    except Exception as e:
+        logger.error(f"Error extracting data from {source_name}: {str(e)}")
+        return {"raw_text": "", "error": str(e)}
+
+def extract_text_with_backend(pdf_source: PdfSource, backend: str) -> str:
+    """Extract text from a PDF with one specific backend."""
+    if backend == 'pymupdf':
+        return extract_text_pymupdf(pdf_source)
+    if backend == 'pypdf2':
+        return extract_text_pypdf2(open_source(pdf_source))
+    with pdfplumber.open(open_source(pdf_source)) as pdf:
+        return extract_text_pdfplumber(pdf)
+
+def open_source(pdf_source: PdfSource) -> Union[str, IO[bytes]]:
+    """Return something pdfplumber and PyPDF2 can open, rewound to the start."""
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return io.BytesIO(pdf_source)
+    if not isinstance(pdf_source, str):
+        pdf_source.seek(0)
+    return pdf_source
+
+def describe_source(pdf_source: PdfSource) -> str:
+    """Return a printable name for a PDF source, used for logging."""
+    if isinstance(pdf_source, str):
+        return pdf_source
+    return getattr(pdf_source, 'name', '<in-memory PDF>')
+
+def extract_text_pdfplumber(pdf) -> str:
+    """Extract text from an open pdfplumber document."""
+    full_text = ""
+    for page in pdf.pages:
+        page_text = page.extract_text()
+        if page_text:
+            full_text += page_text + "\n"
+    return full_text
+
+def extract_text_pypdf2(pdf_file: Union[str, IO[bytes]]) -> str:
+    """Extract text from a PDF path or binary stream with PyPDF2."""
+    reader = PdfReader(pdf_file)
+    full_text = ""
+    for page in reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            full_text += page_text + "\n"
+    return full_text
+
+def extract_text_pymupdf(pdf_source: PdfSource) -> str:
+    """Extract text from a PDF path, bytes or binary stream with PyMuPDF."""
+    if isinstance(pdf_source, str):
+        doc = fitz.open(pdf_source)
+    else:
+        if not isinstance(pdf_source, (bytes, bytearray)):
+            pdf_source = open_source(pdf_source).read()
+        doc = fitz.open(stream=pdf_source, filetype="pdf")
+    
+    full_text = ""
+    with doc:
+        for page in doc:
+            page_text = page.get_text()
+            if page_text:
+                full_text += page_text + "\n"
+    return full_text
+
+def build_resume_data(full_text: str, source: str) -> Dict:
+    """
+    Build structured resume data from extracted text.
+    
+    Args:
+        full_text (str): Text extracted from the PDF
+        source (str): Name of the PDF, used for logging
+        
+    Returns:
+        Dict: Structured resume data
+    """
+    if not full_text.strip():
+        logger.warning(f"No text extracted from {source}")
+        return {"raw_text": "", "error": "No text found in PDF"}
+    
+    # Extract structured information
+    resume_data = {
+        "raw_text": full_text,
+        "name": extract_name(full_text),
+        "email": extract_email(full_text),
+        "phone": extract_phone(full_text),
+        "skills": extract_skills(full_text),
+        "experience": extract_experience(full_text),
+        "education": extract_education(full_text),
+        "linkedin": extract_linkedin(full_text)
+    }
+    
+    logger.info(f"Successfully extracted data from {source}")
+    return resume_data
+
 def extract_name(text: str) -> str:
     """Extract candidate name from resume text."""
     lines = text.split('\n')
@@ -98,51 +262,13 @@ def extract_linkedin(text: str) -> str:
 
 def extract_skills(text: str) -> List[str]:
     """Extract technical skills from resume text."""
-    # Common technical skills database
-    skills_database = {
-        'programming_languages': [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust',
-            'kotlin', 'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell',
-            'bash', 'powershell', 'sql', 'html', 'css', 'sass', 'less'
-        ],
-        'ml_ai': [
-            'machine learning', 'deep learning', 'neural networks', 'tensorflow', 'pytorch',
-            'keras', 'scikit-learn', 'pandas', 'numpy', 'opencv', 'nlp', 'computer vision',
-            'reinforcement learning', 'transformers', 'bert', 'gpt', 'llm', 'ai', 'ml'
-        ],
-        'web_frameworks': [
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'fastapi',
-            'spring', 'spring boot', 'laravel', 'rails', 'asp.net', 'next.js', 'nuxt.js'
-        ],
-        'databases': [
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-            'oracle', 'sql server', 'sqlite', 'firebase', 'dynamodb', 'neo4j'
-        ],
-        'cloud_devops': [
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab ci',
-            'github actions', 'terraform', 'ansible', 'chef', 'puppet', 'vagrant'
-        ],
-        'tools': [
-            'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack',
-            'postman', 'swagger', 'figma', 'adobe', 'photoshop', 'illustrator'
-        ],
-        'data_engineering': [
-            'hadoop', 'spark', 'kafka', 'airflow', 'snowflake', 'databricks',
-            'etl', 'data pipeline', 'big data', 'data warehouse', 'data lake'
-        ]
-    }
-    
     found_skills = []
     text_lower = text.lower()
     
     # Extract skills from all categories
-    for category, skills_list in skills_database.items():
-        for skill in skills_list:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                # Add the properly formatted skill name
-                found_skills.append(skill.title())
+    for pattern, skill_name in SKILL_PATTERNS:
+        if pattern.search(text_lower):
+            found_skills.append(skill_name)
     
     # Look for skills in common sections
     skills_sections = extract_skills_section(text)
@@ -0,0 +1,91 @@
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pdf_parser import PdfSource, describe_source, extract_resume_data_smart
+from nlp_analyzer import analyze_candidate_profile, classify_domain
+
+logger = logging.getLogger(__name__)
+
+def process_resume(pdf_source: PdfSource, filename: Optional[str] = None, backend: str = 'auto') -> Dict:
+    """
+    Run the full extraction and analysis pipeline for a single resume.
+
+    This runs inside worker processes, so it must stay a top-level function
+    (picklable) and must not touch Streamlit.
+
+    Args:
+        pdf_source (PdfSource): Path or raw bytes of the PDF
+        filename (Optional[str]): Display name (defaults to the path's basename)
+        backend (str): PDF text extractor, one of pdf_parser.PARSER_BACKENDS
+
+    Returns:
+        Dict: Candidate information ready for display
+    """
+    resume_data = extract_resume_data_smart(pdf_source, backend)
+    profile = analyze_candidate_profile(resume_data)
+    domain = classify_domain(profile['skills'])
+    skills = profile.get('skills', [])
+
+    return {
+        'name': profile.get('name', 'Unknown'),
+        'email': profile.get('email', 'Not provided'),
+        'phone': profile.get('phone', 'Not provided'),
+        'domain': domain,
+        'experience_years': profile.get('experience_years', 0),
+        'skills': skills,
+        # Skills normalized once here so matching does not redo it per job
+        'skills_lc': [skill.lower().strip() for skill in skills],
+        'education': profile.get('education', 'Not specified'),
+        'filename': filename or os.path.basename(describe_source(pdf_source))
+    }
+
+def process_resumes_parallel(pdf_sources: List[PdfSource], filenames: Optional[List[str]] = None, max_workers: Optional[int] = None, backend: str = 'auto') -> Iterator[Tuple[int, Optional[Dict], Optional[Exception]]]:
+    """
+    Process several resumes concurrently, yielding results as they complete.
+
+    Each file is independent and CPU-bound, so they are fanned out to a
+    process pool. A failure in one file is reported for that file only.
+
+    Args:
+        pdf_sources (List[PdfSource]): Paths or raw bytes of the PDF files
+        filenames (Optional[List[str]]): Display names, one per source
+        max_workers (Optional[int]): Worker processes (defaults to CPU count)
+        backend (str): PDF text extractor, one of pdf_parser.PARSER_BACKENDS
+
+    Yields:
+        Tuple[int, Optional[Dict], Optional[Exception]]: Index into pdf_sources,
+        candidate info (or None) and the error raised (or None)
+    """
+    if not pdf_sources:
+        return
+
+    if filenames is None:
+        filenames = [None] * len(pdf_sources)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pdf_sources))
+
+    # Not worth paying for process start-up with a single file or worker
+    if workers <= 1:
+        for index, (pdf_source, filename) in enumerate(zip(pdf_sources, filenames)):
+            try:
+                yield index, process_resume(pdf_source, filename, backend), None
+            except Exception as e:
+                logger.error(f"Error processing {filename or describe_source(pdf_source)}: {str(e)}")
+                yield index, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_resume, pdf_source, filename, backend): index
+            for index, (pdf_source, filename) in enumerate(zip(pdf_sources, filenames))
+        }
+
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                yield index, future.result(), None
+            except Exception as e:
+                logger.error(f"Error processing {filenames[index] or describe_source(pdf_sources[index])}: {str(e)}")
+                yield index, None, e
@@ -315,7 +315,10 @@ def create_top_candidates_radar(top_candidates: List[Dict], job_requirements: Di
     # Define categories for radar chart
     categories = ['Domain Match', 'Skills Match', 'Experience Match', 'Overall Score']
     
-    fig = go.Figure()
+    traces = []
+    
+    # Same for every candidate, so normalize the required skills once
+    required_skills = frozenset(skill.lower() for skill in job_requirements.get('required_skills', []))
     
     for i, candidate in enumerate(top_candidates[:5]):  # Max 5 candidates
         # Calculate individual scores (simplified)
@@ -323,7 +326,6 @@ def create_top_candidates_radar(top_candidates: List[Dict], job_requirements: Di
         
         # Skills match ratio
         candidate_skills = set(skill.lower() for skill in candidate.get('skills', []))
-        required_skills = set(skill.lower() for skill in job_requirements.get('required_skills', []))
         skills_score = len(candidate_skills & required_skills) / max(len(required_skills), 1)
         
         # Experience score
@@ -335,7 +337,7 @@ def create_top_candidates_radar(top_candidates: List[Dict], job_requirements: Di
         
         values = [domain_score, skills_score, exp_score, overall_score]
         
-        fig.add_trace(go.Scatterpolar(
+        traces.append(go.Scatterpolar(
             r=values,
             theta=categories,
             fill='toself',
@@ -343,14 +345,18 @@ def create_top_candidates_radar(top_candidates: List[Dict], job_requirements: Di
             line=dict(width=2)
         ))
     
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 1]
-            )),
-        showlegend=True,
-        title="Top Candidates Comparison"
+    # Build the figure once with every trace instead of validating it per add_trace
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 1]
+                )),
+            showlegend=True,
+            title="Top Candidates Comparison"
+        )
     )
     
     return fig
@@ -398,12 +404,15 @@ def create_skills_gap_analysis(candidates_data: List[Dict], required_skills: Lis
     skill_coverage = {}
     total_candidates = len(candidates_data)
     
+    # Lowercase every candidate's skills once, not once per required skill
+    candidates_skills = [[s.lower() for s in candidate.get('skills', [])] for candidate in candidates_data]
+    
     for skill in required_skills:
-        count = 0
-        for candidate in candidates_data:
-            candidate_skills = [s.lower() for s in candidate.get('skills', [])]
-            if any(skill.lower() in cs for cs in candidate_skills):
-                count += 1
+        skill_lower = skill.lower()
+        count = sum(
+            1 for candidate_skills in candidates_skills
+            if any(skill_lower in cs for cs in candidate_skills)
+        )
         skill_coverage[skill] = (count / total_candidates) * 100
     
     # Create bar chart